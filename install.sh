@@ -13,7 +13,7 @@ SCRIPT_DIR="$(cd -P "$(dirname -- "${SCRIPT_PATH}")" >/dev/null 2>&1 && pwd)"
 if [ "$EUID" -ne 0 ]
 then 
     echo "Please run as root"
-    exit
+    exit 1
 fi
 
 
@@ -21,7 +21,7 @@ fi
 echo "Checking prequisites ..."
 
 echo "Test required binaries"
-for bin in "systemctl" "pinctrl" "bash"
+for bin in "systemctl" "pinctrl" "bash" "install"
 do
   if ! command -v "$bin" &> /dev/null
   then
@@ -32,18 +32,13 @@ do
   fi
 done
 
-echo "Test "
-
 
 # Install shell scripts
-chmod 755 "$SCRIPT_DIR"/src/*.sh
-cp "$SCRIPT_DIR"/src/*.sh /usr/local/bin/
+install -m 755 "$SCRIPT_DIR"/src/*.sh /usr/local/bin/
 
 
 # Install systemd units
-chmod 644 "$SCRIPT_DIR"/src/*.service
-cp "$SCRIPT_DIR"/src/*.service /etc/systemd/system/
+install -m 644 "$SCRIPT_DIR"/src/*.service /etc/systemd/system/
 
-systemctl enable x730poweroff
-systemctl enable x730reboot
-systemctl enable --now x730button
+systemctl enable x730poweroff x730reboot x730button
+systemctl start x730button
@@ -1,38 +1,67 @@
 #!/usr/bin/env bash
 
-SHUTDOWN=4
-REBOOT_PULSE_MINIMUM_MILLISECONDS=200
-REBOOT_PULSE_MAXIMUM_MILLISECONDS=600
-SLEEP_PULSE_SECONDS="0.200"
+SCRIPT_PATH="${BASH_SOURCE}"
+while [ -L "${SCRIPT_PATH}" ]; do
+  SCRIPT_DIR="$(cd -P "$(dirname "${SCRIPT_PATH}")" >/dev/null 2>&1 && pwd)"
+  SCRIPT_PATH="$(readlink "${SCRIPT_PATH}")"
+  [[ ${SCRIPT_PATH} != /* ]] && SCRIPT_PATH="${SCRIPT_DIR}/${SCRIPT_PATH}"
+done
+SCRIPT_PATH="$(readlink -f "${SCRIPT_PATH}")"
+SCRIPT_DIR="$(cd -P "$(dirname -- "${SCRIPT_PATH}")" >/dev/null 2>&1 && pwd)"
+
+source "${SCRIPT_DIR}/x730lib.sh"
+
+SHUTDOWN="${X730_SHUTDOWN_PIN:-4}"
+REBOOT_PULSE_MINIMUM_MILLISECONDS="${X730_REBOOT_PULSE_MINIMUM_MILLISECONDS:-200}"
+REBOOT_PULSE_MAXIMUM_MILLISECONDS="${X730_REBOOT_PULSE_MAXIMUM_MILLISECONDS:-600}"
+SLEEP_IDLE_SECONDS="${X730_SLEEP_IDLE_SECONDS:-0.050}"
+SLEEP_PULSE_SECONDS="${X730_SLEEP_PULSE_SECONDS:-0.020}"
 pinctrl set "$SHUTDOWN" ip pd
 
-BOOT=17
+BOOT="${X730_BOOT_PIN:-17}"
 pinctrl set "$BOOT" op pn dl
 pinctrl set "$BOOT" dh
 
-python() {
-  "$(command -v python3 || command -v python || command -v python2)" "$@"
-}
-
-exSleep() {
-  sleep "$1" \
-	|| perl -e "select(undef, undef, undef, $1)" \
-	|| python -c "import time; time.sleep($1)"
-}
-
 getShutdownSignal() {
 	pinctrl lev "$SHUTDOWN"
 }
 
+TIMESTAMP_IMPL=""
+PULSE_TIMESTAMP=""
 getPulseTimestamp() {
-  if [ -n "$EPOCHREALTIME" ]
+  if [ -z "$TIMESTAMP_IMPL" ]
   then
-    local us="${EPOCHREALTIME/[^0-9]/}"
-    echo "${us:0:-3}"
-  else
-    python -c "import time; print(int(time.time() * 1000))" \
-	  || date +%s%3N
-	fi
+    if [ -r /proc/uptime ]
+    then
+      TIMESTAMP_IMPL="uptime"
+    elif [ -n "$EPOCHREALTIME" ]
+    then
+      TIMESTAMP_IMPL="epochrealtime"
+    elif python -c "import time" 2> /dev/null
+    then
+      TIMESTAMP_IMPL="python"
+    else
+      TIMESTAMP_IMPL="date"
+    fi
+  fi
+
+  case "$TIMESTAMP_IMPL" in
+    uptime)
+      local uptime _idle
+      read -r uptime _idle < /proc/uptime
+      PULSE_TIMESTAMP=$(( 10#${uptime/./} * 10 ))
+      ;;
+    epochrealtime)
+      local us="${EPOCHREALTIME/[^0-9]/}"
+      PULSE_TIMESTAMP="${us:0:-3}"
+      ;;
+    python) PULSE_TIMESTAMP="$(python -c "import time; print(int(time.time() * 1000))")" ;;
+    *) PULSE_TIMESTAMP="$(date +%s%3N)" ;;
+  esac
+}
+
+sleepIdle() {
+	exSleep "$SLEEP_IDLE_SECONDS"
 }
 
 sleepPulse() {
@@ -46,24 +75,32 @@ do
 	shutdownSignal=$(getShutdownSignal)
 	if [ "$shutdownSignal" = 0 ]
 	then
-		sleepPulse
+		sleepIdle
 	else
-		pulseStart=$(getPulseTimestamp)
+		getPulseTimestamp
+		pulseStart=$PULSE_TIMESTAMP
 		while [ "$shutdownSignal" = 1 ]
 		do
 			sleepPulse
-			if [ $(( $(getPulseTimestamp) - $pulseStart )) -gt $REBOOT_PULSE_MAXIMUM_MILLISECONDS ]
+			getPulseTimestamp
+			if [ $(( $PULSE_TIMESTAMP - $pulseStart )) -gt $REBOOT_PULSE_MAXIMUM_MILLISECONDS ]
 			then
 				echo "X730 Shutting down, halting Rpi ..."
-				sudo poweroff
+				poweroff
 				exit
 			fi
 			shutdownSignal=$(getShutdownSignal)
+			if [ "$shutdownSignal" = 0 ]
+			then
+				# Debounce: accept the release only if it is still low one sample later
+				sleepPulse
+				shutdownSignal=$(getShutdownSignal)
+			fi
 		done
-		if [ $(( $(getPulseTimestamp) - $pulseStart )) -gt $REBOOT_PULSE_MINIMUM_MILLISECONDS ]
+		if [ $(( $PULSE_TIMESTAMP - $pulseStart )) -gt $REBOOT_PULSE_MINIMUM_MILLISECONDS ]
 		then
 			echo "X730 Rebooting, recycling Rpi ..."
-			sudo reboot
+			reboot
 			exit
 		fi
 	fi
@@ -0,0 +1,38 @@
+#!/usr/bin/env bash
+# Shared helpers for the x730 scripts. Meant to be sourced, not executed.
+
+PYTHON_BIN=""
+python() {
+  if [ -z "$PYTHON_BIN" ]
+  then
+    PYTHON_BIN="$(command -v python3 || command -v python || command -v python2)"
+  fi
+  "$PYTHON_BIN" "$@"
+}
+
+SLEEP_IMPL=""
+SLEEP_FD=""
+exSleep() {
+  if [ -z "$SLEEP_IMPL" ]
+  then
+    if exec {SLEEP_FD}<> <(:) 2> /dev/null
+    then
+      SLEEP_IMPL="read"
+    elif sleep "0.001" 2> /dev/null
+    then
+      SLEEP_IMPL="sleep"
+    elif perl -e "select(undef, undef, undef, 0.001)" 2> /dev/null
+    then
+      SLEEP_IMPL="perl"
+    else
+      SLEEP_IMPL="python"
+    fi
+  fi
+
+  case "$SLEEP_IMPL" in
+    read) read -r -t "$1" -u "$SLEEP_FD" || : ;;
+    sleep) sleep "$1" ;;
+    perl) perl -e "select(undef, undef, undef, $1)" ;;
+    *) python -c "import time; time.sleep($1)" ;;
+  esac
+}
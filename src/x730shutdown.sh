@@ -1,16 +1,21 @@
 #!/usr/bin/env bash
 
-BUTTON=18
+SCRIPT_PATH="${BASH_SOURCE}"
+while [ -L "${SCRIPT_PATH}" ]; do
+  SCRIPT_DIR="$(cd -P "$(dirname "${SCRIPT_PATH}")" >/dev/null 2>&1 && pwd)"
+  SCRIPT_PATH="$(readlink "${SCRIPT_PATH}")"
+  [[ ${SCRIPT_PATH} != /* ]] && SCRIPT_PATH="${SCRIPT_DIR}/${SCRIPT_PATH}"
+done
+SCRIPT_PATH="$(readlink -f "${SCRIPT_PATH}")"
+SCRIPT_DIR="$(cd -P "$(dirname -- "${SCRIPT_PATH}")" >/dev/null 2>&1 && pwd)"
+
+source "${SCRIPT_DIR}/x730lib.sh"
+
+BUTTON="${X730_BUTTON_PIN:-18}"
 
 pinctrl set "$BUTTON" op pn dl
 pinctrl set "$BUTTON" dh
 
-exSleep() {
-  sleep "$1" \
-	|| perl -e "select(undef, undef, undef, $1)" \
-	|| python3 -c "import time; time.sleep($1)"
-}
-
 # 1-2 sec for reboot, 3-7 for poweroff (default) 8+ crash (pull the plug)
 SLEEP=${1:-4}
 
@@ -13,18 +13,27 @@ SCRIPT_DIR="$(cd -P "$(dirname -- "${SCRIPT_PATH}")" >/dev/null 2>&1 && pwd)"
 if [ "$EUID" -ne 0 ]
 then 
     echo "Please run as root"
-    exit
+    exit 1
 fi
 
 
+UNITS=("x730poweroff" "x730reboot" "x730button")
+SCRIPTS=("x730shutdown.sh" "x730button.sh" "x730lib.sh")
+
+
 # Uninstall systemd units
-systemctl disable x730poweroff
-systemctl disable x730reboot
-systemctl disable --now x730button
-rm /etc/systemd/system/x730poweroff.service
-rm /etc/systemd/system/x730reboot.service
-rm /etc/systemd/system/x730button.service
+systemctl disable --now "${UNITS[@]}"
+UNIT_FILES=()
+for unit in "${UNITS[@]}"
+do
+  UNIT_FILES+=("/etc/systemd/system/${unit}.service")
+done
+rm -f "${UNIT_FILES[@]}"
 
 # Unnstall shell scripts
-rm /usr/local/bin/x730shutdown.sh
-rm /usr/local/bin/x730button.sh
+SCRIPT_FILES=()
+for script in "${SCRIPTS[@]}"
+do
+  SCRIPT_FILES+=("/usr/local/bin/${script}")
+done
+rm -f "${SCRIPT_FILES[@]}"